@@ -18,9 +18,12 @@ def create_dataloader(dataset, dataset_opt, opt=None, sampler=None, collate_fn=N
         else:
             num_workers = dataset_opt['n_workers']
             batch_size = dataset_opt['batch_size']
+        # Workers are kept alive across epochs, so per-worker state such as the text cleaner caches
+        # is reused.
         return torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=shuffle,
                                            num_workers=num_workers, sampler=sampler, drop_last=True,
-                                           pin_memory=pin_memory, collate_fn=collate_fn)
+                                           pin_memory=pin_memory, collate_fn=collate_fn,
+                                           persistent_workers=num_workers > 0)
     else:
         batch_size = dataset_opt['batch_size'] or 1
         return torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=False, num_workers=0,
@@ -70,9 +70,11 @@ class FastPairedVoiceDataset(torch.utils.data.Dataset):
         self.use_bpe_tokenizer = opt_get(hparams, ['use_bpe_tokenizer'], False)
         if self.use_bpe_tokenizer:
             from data.audio.voice_tokenizer import VoiceBpeTokenizer
-            self.tokenizer = VoiceBpeTokenizer(opt_get(hparams, ['tokenizer_vocab'], '../experiments/bpe_lowercase_asr_256.json'))
+            vocab = opt_get(hparams, ['tokenizer_vocab'],
+                            '../experiments/bpe_lowercase_asr_256.json')
+            self.tokenizer = VoiceBpeTokenizer(vocab, self.text_cleaners)
         else:
-            self.tokenizer = CharacterTokenizer()
+            self.tokenizer = CharacterTokenizer(self.text_cleaners)
         self.ipa_phoneme_tokenizer = Wav2Vec2Processor.from_pretrained("facebook/wav2vec2-lv-60-espeak-cv-ft").tokenizer
         self.ipa_phoneme_tokenizer.do_phonemize = False
         self.skipped_items = 0  # records how many items are skipped when accessing an index.
@@ -9,6 +9,7 @@ from tqdm import tqdm
 from models.audio.tts.tacotron2 import load_filepaths_and_text
 from models.audio.tts.tacotron2 import symbols
 from models.audio.tts.tacotron2 import text_to_sequence
+from utils.util import opt_get
 
 
 class GptTtsDataset(torch.utils.data.Dataset):
@@ -21,7 +22,7 @@ class GptTtsDataset(torch.utils.data.Dataset):
     def __init__(self, opt):
         self.path = os.path.dirname(opt['path'])
         self.audiopaths_and_text = load_filepaths_and_text(opt['path'])
-        self.text_cleaners=['english_cleaners']
+        self.text_cleaners = opt_get(opt, ['text_cleaners'], ['english_cleaners'])
 
         self.MEL_DICTIONARY_SIZE = opt['mel_vocab_size']+3
         self.MEL_START_TOKEN = LongTensor([self.MEL_DICTIONARY_SIZE-3])
@@ -114,8 +114,11 @@ def load_voxpopuli(filename, type):
 
 
 class CharacterTokenizer:
+    def __init__(self, text_cleaners=['english_cleaners']):
+        self.text_cleaners = text_cleaners
+
     def encode(self, txt):
-        return text_to_sequence(txt, ['english_cleaners'])
+        return text_to_sequence(txt, self.text_cleaners)
 
     def decode(self, seq):
         return sequence_to_text(seq)
@@ -166,9 +169,11 @@ class TextWavLoader(torch.utils.data.Dataset):
         self.use_bpe_tokenizer = opt_get(hparams, ['use_bpe_tokenizer'], True)
         if self.use_bpe_tokenizer:
             from data.audio.voice_tokenizer import VoiceBpeTokenizer
-            self.tokenizer = VoiceBpeTokenizer(opt_get(hparams, ['tokenizer_vocab'], '../experiments/bpe_lowercase_asr_256.json'))
+            vocab = opt_get(hparams, ['tokenizer_vocab'],
+                            '../experiments/bpe_lowercase_asr_256.json')
+            self.tokenizer = VoiceBpeTokenizer(vocab, self.text_cleaners)
         else:
-            self.tokenizer = CharacterTokenizer()
+            self.tokenizer = CharacterTokenizer(self.text_cleaners)
         self.skipped_items = 0  # records how many items are skipped when accessing an index.
 
     def get_wav_text_pair(self, audiopath_and_text):
@@ -8,6 +8,7 @@ from tokenizers.trainers import BpeTrainer
 
 from data.audio.paired_voice_audio_dataset import load_mozilla_cv, load_voxpopuli, load_tsv
 from models.audio.tts.tacotron2 import load_filepaths_and_text
+from models.audio.tts.tacotron2.text import cleaners
 from models.audio.tts.tacotron2.text.cleaners import english_cleaners
 
 
@@ -29,12 +30,14 @@ def remove_extraneous_punctuation(word):
 
 
 class VoiceBpeTokenizer:
-    def __init__(self, vocab_file):
+    def __init__(self, vocab_file, text_cleaners=['english_cleaners']):
         if vocab_file is not None:
             self.tokenizer = Tokenizer.from_file(vocab_file)
+        self.text_cleaners = text_cleaners
 
     def preprocess_text(self, txt):
-        txt = english_cleaners(txt)
+        for name in self.text_cleaners:
+            txt = getattr(cleaners, name)(txt)
         txt = remove_extraneous_punctuation(txt)
         return txt
 
@@ -1,12 +1,16 @@
 import re
+from functools import lru_cache
 from unidecode import unidecode
-from numbers import normalize_numbers
+from models.audio.tts.tacotron2.text.numbers import normalize_numbers
 
 # Regular expression matching whitespace:
 _whitespace_re = re.compile(r'\s+')
 
-# List of (regular expression, replacement) pairs for abbreviations:
-_abbreviations = [(re.compile('\\b%s\\.' % x[0], re.IGNORECASE), x[1]) for x in [
+# Regular expression matching whitespace that collapse_whitespace would change:
+_redundant_whitespace_re = re.compile(r'\s{2,}|[^\S ]')
+
+# Mapping from abbreviation to its expansion:
+_abbreviations = dict([
     ('mrs', 'misess'),
     ('mr', 'mister'),
     ('dr', 'doctor'),
@@ -25,13 +29,32 @@ _abbreviations = [(re.compile('\\b%s\\.' % x[0], re.IGNORECASE), x[1]) for x in
     ('ltd', 'limited'),
     ('col', 'colonel'),
     ('ft', 'fort'),
-]]
+])
+
+# Regular expression matching any of the abbreviations above, followed by a period. Alternatives are
+# tried longest first so that a prefix (e.g. 'dr') never shadows a longer abbreviation (e.g. 'drs'):
+_abbreviations_longest_first = sorted(_abbreviations, key=len, reverse=True)
+_abbreviations_re = re.compile(r'\b(%s)\.' % '|'.join(_abbreviations_longest_first), re.IGNORECASE)
+
+# Number of distinct inputs each cleaner pipeline remembers. Pipelines are pure, and training
+# dataloaders keep their workers (and so these caches) alive across epochs, so repeated transcripts
+# skip the regex chain:
+_pipeline_cache_size = 1 << 17
+
+# Translation table mapping Arabic-Urdu numerals to ASCII digits:
+_urdu_digits_trans = str.maketrans('۰۱۲۳۴۵۶۷۸۹', '0123456789')
+
+# Translation table mapping Urdu numerals and punctuation to their ASCII equivalents:
+_urdu_trans = {**_urdu_digits_trans, **str.maketrans({
+    '٫': '.',
+    '٪': '%',
+})}
 
 def expand_abbreviations(text):
     """Expand common abbreviations."""
-    for regex, replacement in _abbreviations:
-        text = re.sub(regex, replacement, text)
-    return text
+    # casefold() rather than lower(): the case-insensitive match also accepts characters such as
+    # 'ſ' (long s), which only casefold() maps back onto the ASCII keys.
+    return _abbreviations_re.sub(lambda m: _abbreviations[m.group(1).casefold()], text)
 
 def expand_numbers(text):
     """Expand numbers to words."""
@@ -43,10 +66,14 @@ def lowercase(text):
 
 def collapse_whitespace(text):
     """Collapse multiple whitespaces to a single space."""
-    return re.sub(_whitespace_re, ' ', text)
+    if _redundant_whitespace_re.search(text) is None:
+        return text
+    return _whitespace_re.sub(' ', text)
 
 def convert_to_ascii(text):
     """Convert text to ASCII representation."""
+    if text.isascii():
+        return text
     return unidecode(text)
 
 def normalize_urdu_text(text):
@@ -55,19 +82,17 @@ def normalize_urdu_text(text):
     - Normalize Arabic-Urdu numerals
     - Remove extra spaces
     """
-    # Normalize Arabic-Urdu numerals to standard form
-    urdu_to_arabic_numerals = str.maketrans(
-        '۰۱۲۳۴۵۶۷۸۹',
-        '0123456789'
-    )
-    text = text.translate(urdu_to_arabic_numerals)
+    # Normalize Arabic-Urdu numerals to standard form; pure ASCII text has none to translate.
+    if not text.isascii():
+        text = text.translate(_urdu_digits_trans)
     
     # Remove extra spaces and normalize punctuation
-    text = re.sub(r'\s+', ' ', text)
+    text = collapse_whitespace(text)
     text = text.strip()
     
     return text
 
+@lru_cache(maxsize=_pipeline_cache_size)
 def basic_cleaners(text):
     """
     Basic pipeline that lowercases and collapses whitespace 
@@ -77,6 +102,7 @@ def basic_cleaners(text):
     text = collapse_whitespace(text)
     return text
 
+@lru_cache(maxsize=_pipeline_cache_size)
 def transliteration_cleaners(text):
     """
     Pipeline for non-English text that transliterates to ASCII.
@@ -86,6 +112,7 @@ def transliteration_cleaners(text):
     text = collapse_whitespace(text)
     return text
 
+@lru_cache(maxsize=_pipeline_cache_size)
 def english_cleaners(text):
     """
     Pipeline for English text, including normalization.
@@ -97,14 +124,15 @@ def english_cleaners(text):
     text = text.replace('"', '')
     return text
 
+@lru_cache(maxsize=_pipeline_cache_size)
 def urdu_cleaners(text):
     """
     Pipeline for Urdu text cleaning.
     """
-    text = normalize_urdu_text(text)
+    if not text.isascii():
+        text = text.translate(_urdu_trans)
     text = collapse_whitespace(text)
-    text = text.replace('٫', '.').replace('٪', '%')
-    return text
+    return text.strip()
 
 def multilingual_cleaners(text, language='english'):
     """
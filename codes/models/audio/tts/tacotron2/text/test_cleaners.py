@@ -0,0 +1,30 @@
+from models.audio.tts.tacotron2.text import cleaners
+from models.audio.tts.tacotron2.text.cleaners import english_cleaners, expand_abbreviations
+
+
+def test_import_and_expand_numbers():
+    # Guards against normalize_numbers being imported from the stdlib 'numbers' module again.
+    assert cleaners.english_cleaners('i have 2 dogs') == 'i have two dogs'
+
+
+def test_expand_abbreviations():
+    assert (expand_abbreviations('Mr. Smith met Drs. Who and Dr. No.')
+            == 'mister Smith met doctors Who and doctor No.')
+
+
+def test_expand_abbreviations_long_s():
+    # 'ſ' (long s) matches 's' case-insensitively; it must not break the expansion lookup.
+    assert english_cleaners('the ſt. louis') == 'the saint louis'
+    assert english_cleaners('mrſ. smith') == 'misess smith'
+
+
+def test_expand_abbreviations_unicode_word_boundary():
+    # Abbreviations only match at a word boundary, and non-ASCII letters count as word characters.
+    assert expand_abbreviations('édr. x') == 'édr. x'
+
+
+def test_expand_abbreviations_glued():
+    # Abbreviations written back to back are all expanded. Before they were matched in a single
+    # pass, the expansion of the first one removed the word boundary in front of the second, leaving
+    # e.g. 'doctordrs.'.
+    assert english_cleaners('Dr.drs.') == 'doctordoctors'
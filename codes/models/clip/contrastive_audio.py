@@ -210,7 +210,7 @@ class ContrastiveAudio(nn.Module):
 
         self.to_latent2.weight.data = self.to_latent.weight.data
         self.to_latent2.weight.DO_NOT_TRAIN = True
-        self.to_latent2.requires_grad = False
+        self.to_latent2.requires_grad_(False)
 
     def get_grad_norm_parameter_groups(self):
         return {
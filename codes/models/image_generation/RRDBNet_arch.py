@@ -305,10 +305,10 @@ class RRDBNet(nn.Module):
 
 @register_model
 def register_RRDBNetBypass(opt_net, opt):
-    additive_mode = opt_net['additive_mode'] if 'additive_mode' in opt_net.keys() else 'not'
-    output_mode = opt_net['output_mode'] if 'output_mode' in opt_net.keys() else 'hq_only'
-    gc = opt_net['gc'] if 'gc' in opt_net.keys() else 32
-    initial_stride = opt_net['initial_stride'] if 'initial_stride' in opt_net.keys() else 1
+    additive_mode = opt_net.get('additive_mode', 'not')
+    output_mode = opt_net.get('output_mode', 'hq_only')
+    gc = opt_net.get('gc', 32)
+    initial_stride = opt_net.get('initial_stride', 1)
     bypass_noise = opt_get(opt_net, ['bypass_noise'], False)
     block = functools.partial(RRDBWithBypass, randomly_add_noise_to_bypass=bypass_noise)
     return RRDBNet(in_channels=opt_net['in_nc'], out_channels=opt_net['out_nc'],
@@ -319,10 +319,10 @@ def register_RRDBNetBypass(opt_net, opt):
 
 @register_model
 def register_RRDBNet(opt_net, opt):
-    additive_mode = opt_net['additive_mode'] if 'additive_mode' in opt_net.keys() else 'not'
-    output_mode = opt_net['output_mode'] if 'output_mode' in opt_net.keys() else 'hq_only'
-    gc = opt_net['gc'] if 'gc' in opt_net.keys() else 32
-    initial_stride = opt_net['initial_stride'] if 'initial_stride' in opt_net.keys() else 1
+    additive_mode = opt_net.get('additive_mode', 'not')
+    output_mode = opt_net.get('output_mode', 'hq_only')
+    gc = opt_net.get('gc', 32)
+    initial_stride = opt_net.get('initial_stride', 1)
     return RRDBNet(in_channels=opt_net['in_nc'], out_channels=opt_net['out_nc'],
                                 mid_channels=opt_net['nf'], num_blocks=opt_net['nb'], additive_mode=additive_mode,
                                 output_mode=output_mode, body_block=RRDB, scale=opt_net['scale'], growth_channels=gc,
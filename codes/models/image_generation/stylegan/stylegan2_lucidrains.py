@@ -913,8 +913,8 @@ class StyleGan2PathLengthLoss(L.ConfigurableLoss):
 
 @register_model
 def register_stylegan2_lucidrains(opt_net, opt):
-    is_structured = opt_net['structured'] if 'structured' in opt_net.keys() else False
-    attn = opt_net['attn_layers'] if 'attn_layers' in opt_net.keys() else []
+    is_structured = opt_net.get('structured', False)
+    attn = opt_net.get('attn_layers', [])
     return StyleGan2GeneratorWithLatent(image_size=opt_net['image_size'], latent_dim=opt_net['latent_dim'],
                                         style_depth=opt_net['style_depth'], structure_input=is_structured,
                                         attn_layers=attn)
@@ -922,7 +922,7 @@ def register_stylegan2_lucidrains(opt_net, opt):
 
 @register_model
 def register_stylegan2_discriminator(opt_net, opt):
-    attn = opt_net['attn_layers'] if 'attn_layers' in opt_net.keys() else []
+    attn = opt_net.get('attn_layers', [])
     disc = StyleGan2Discriminator(image_size=opt_net['image_size'], input_filters=opt_net['in_nc'], attn_layers=attn,
                                   do_checkpointing=opt_get(opt_net, ['do_checkpointing'], False),
                                   quantize=opt_get(opt_net, ['quantize'], False))
@@ -0,0 +1,60 @@
+"""
+Runs the tacotron2 text cleaners over every transcript in a dataset manifest ahead of time, using
+all available cores, and writes out a manifest in the same format containing the cleaned text.
+
+Point a dataset at the output manifest with `text_cleaners: []` and it will no longer run any text
+cleaners while training. This is honoured by the nv_tacotron, gpt_tts and (fast_)paired_voice_audio
+datasets, including their BPE tokenizer, which still applies its own punctuation fix-ups.
+"""
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+from models.audio.tts.tacotron2.text import cleaners
+
+
+# Separator and index of the transcript column for each supported manifest format.
+MANIFEST_FORMATS = {
+    'lj': ('|', 1),  # <path>|<text>[|...], as read by load_filepaths_and_text.
+    'tsv': ('\t', 0),  # <text>\t<path>[\t...], as read by load_tsv.
+}
+
+
+def clean_text(text, cleaner_names):
+    for name in cleaner_names:
+        text = getattr(cleaners, name)(text)
+    return text
+
+
+def precompute_cleaned(manifest_path, out_path, cleaner_names, format='lj', num_workers=None):
+    split, text_column = MANIFEST_FORMATS[format]
+    with open(manifest_path, encoding='utf-8') as f:
+        rows = [line.strip().split(split) for line in f]
+    # Rows without a transcript column are written back untouched; the dataset loaders skip them.
+    to_clean = [row for row in rows if len(row) > text_column]
+    with ProcessPoolExecutor(num_workers) as executor:
+        cleaned = executor.map(functools.partial(clean_text, cleaner_names=cleaner_names),
+                               [row[text_column] for row in to_clean], chunksize=1024)
+        for row, text in zip(to_clean, cleaned):
+            row[text_column] = text
+    with open(out_path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(split.join(row) + '\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--manifest', type=str, required=True,
+                        help='Manifest whose transcripts should be cleaned')
+    parser.add_argument('--output', type=str, required=True,
+                        help='Path to write the cleaned manifest to')
+    parser.add_argument('--format', type=str, choices=list(MANIFEST_FORMATS.keys()), default='lj',
+                        help='Manifest format')
+    parser.add_argument('--cleaners', type=str, default='english_cleaners',
+                        help='Comma separated list of cleaners to apply, in order')
+    parser.add_argument('--num_workers', type=int, default=None,
+                        help='Number of worker processes. Defaults to one per core.')
+    args = parser.parse_args()
+
+    precompute_cleaned(args.manifest, args.output, args.cleaners.split(','), args.format,
+                       args.num_workers)
@@ -1,5 +1,4 @@
 import os
-from collections import OrderedDict
 import torch
 import torch.nn as nn
 from torch.distributed.optim import ZeroRedundancyOptimizer
@@ -114,7 +113,6 @@ class BaseModel():
         # Support loading torch.save()s for whole models as well as just state_dicts.
         if 'state_dict' in load_net:
             load_net = load_net['state_dict']
-        load_net_clean = OrderedDict()  # remove unnecessary 'module.'
 
         if pretrain_base_path is not None:
             t = load_net
@@ -123,12 +121,11 @@ class BaseModel():
                 if k.startswith(pretrain_base_path):
                     load_net[k[len(pretrain_base_path):]] = v
 
-        for k, v in load_net.items():
+        # Remove unnecessary 'module.' in place rather than building a second dict alongside the loaded one.
+        for k in list(load_net.keys()):
             if k.startswith('module.'):
-                load_net_clean[k.replace('module.', '')] = v
-            else:
-                load_net_clean[k] = v
-        network.load_state_dict(load_net_clean, strict=strict)
+                load_net[k.replace('module.', '')] = load_net.pop(k)
+        network.load_state_dict(load_net, strict=strict)
 
 
     def consolidate_state(self):
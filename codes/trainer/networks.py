@@ -32,7 +32,18 @@ def register_model(func):
     return func
 
 
-def find_registered_model_fns(base_path='models'):
+# Cheaply checks whether the source of a module could register the model called `name`, so that model lookups do
+# not need to import (and initialize) every model file in the tree.
+def _may_register_model(mod, name):
+    mod_path = os.path.join(mod.module_finder.path, f'{mod.name}.py')
+    if not os.path.exists(mod_path):
+        return True
+    with open(mod_path, encoding='utf-8', errors='ignore') as f:
+        return f'def register_{name}(' in f.read()
+
+
+# When `name` is given, only modules that look like they register that model are imported.
+def find_registered_model_fns(base_path='models', name=None):
     found_fns = {}
     module_iter = pkgutil.walk_packages([base_path])
     for mod in module_iter:
@@ -41,8 +52,8 @@ def find_registered_model_fns(base_path='models'):
         if mod.ispkg:
             EXCLUSION_LIST = ['flownet2']
             if mod.name not in EXCLUSION_LIST:
-                found_fns.update(find_registered_model_fns(f'{base_path}/{mod.name}'))
-        else:
+                found_fns.update(find_registered_model_fns(f'{base_path}/{mod.name}', name))
+        elif name is None or _may_register_model(mod, name):
             mod_name = f'{base_path}/{mod.name}'.replace('/', '.')
             importlib.import_module(mod_name)
             for mod_fn in getmembers(sys.modules[mod_name], isfunction):
@@ -58,6 +69,10 @@ class CreateModelError(Exception):
                          f'{available}')
 
 
+# Model build functions discovered so far, shared by every create_model() call in this process.
+_registered_model_fns = {}
+
+
 def create_model(opt, opt_net, other_nets=None):
     which_model = opt_net['which_model']
     # For backwards compatibility.
@@ -65,11 +80,16 @@ def create_model(opt, opt_net, other_nets=None):
         which_model = opt_net['which_model_G']
     if not which_model:
         which_model = opt_net['which_model_D']
-    registered_fns = find_registered_model_fns()
-    if which_model not in registered_fns.keys():
-        raise CreateModelError(which_model, list(registered_fns.keys()))
-    num_params = len(signature(registered_fns[which_model]).parameters)
+    if which_model not in _registered_model_fns:
+        _registered_model_fns.update(find_registered_model_fns(name=which_model))
+    if which_model not in _registered_model_fns:
+        # Fall back to importing everything, which also gives the error below a complete list of available models.
+        _registered_model_fns.update(find_registered_model_fns())
+    if which_model not in _registered_model_fns:
+        raise CreateModelError(which_model, list(_registered_model_fns.keys()))
+    model_fn = _registered_model_fns[which_model]
+    num_params = len(signature(model_fn).parameters)
     if num_params == 2:
-        return registered_fns[which_model](opt_net, opt)
+        return model_fn(opt_net, opt)
     else:
-        return registered_fns[which_model](opt_net, opt, other_nets)
+        return model_fn(opt_net, opt, other_nets)